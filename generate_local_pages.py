@@ -1,10 +1,25 @@
 import os
+import sys
 import csv
 import re
+import string
 import argparse
+import contextlib
+import functools
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as json  # Faster JSON parsing and serialization when available
+except ImportError:
+    import json
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -25,6 +40,11 @@ def parse_arguments():
         action='store_true',
         help='Preview pages without creating them in WordPress'
     )
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='Create pages in groups through the WordPress REST batch endpoint (WordPress 5.6+)'
+    )
     parser.add_argument(
         '--limit',
         type=int,
@@ -40,6 +60,52 @@ wp_url = os.getenv("WP_URL")
 username = os.getenv("WP_USERNAME")
 app_password = os.getenv("WP_APP_PASSWORD").replace(" ", "")  # Remove spaces
 
+# Shared HTTP session: keep-alive connections are reused across rows
+SESSION = requests.Session()
+SESSION.auth = HTTPBasicAuth(username, app_password)
+SESSION.verify = False
+SESSION.headers["Content-Type"] = "application/json"
+# Certificate verification is disabled on purpose, don't warn on every request
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    # Only failed connections are retried. POSTs are deliberately not retried on
+    # error status codes, since a retry could create a duplicate page
+    max_retries=Retry(total=3, backoff_factor=0.3)
+)
+SESSION.mount("https://", _adapter)
+SESSION.mount("http://", _adapter)
+
+# Maximum number of pages created in WordPress at the same time
+MAX_WORKERS = 16
+
+# Number of CSV rows read and sent to WordPress at a time
+BATCH_SIZE = 500
+
+# Maximum number of pages in one WordPress batch request (limit set by WordPress)
+WP_BATCH_SIZE = 25
+
+# Fields of a created page returned by WordPress that are used by the script
+_PAGE_FIELDS = ('id', 'slug', 'link')
+
+# Page payloads reused per worker thread
+_payload_local = threading.local()
+
+# Columns every CSV row must fill in
+_REQUIRED_FIELDS = ('service', 'city', 'neighborhood', 'price_from')
+
+# Number of generated content results kept in memory
+CONTENT_CACHE_SIZE = 4096
+
+# Characters not allowed in page slugs
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Whitespace normalized in page content
+_MULTISPACE = re.compile(r'  +')
+_MULTINL = re.compile(r'\n{3,}')
+
+@functools.lru_cache(maxsize=CONTENT_CACHE_SIZE)
 def get_ai_content(content_type, service, city, neighborhood, price_from):
     """
     Placeholder for AI content generation function.
@@ -50,6 +116,8 @@ def get_ai_content(content_type, service, city, neighborhood, price_from):
     city - city name
     neighborhood - neighborhood name
     price_from - starting price
+    
+    Results are cached, so repeated service/city/neighborhood rows are generated once.
     """
     placeholders = {
         'intro': f"Professional {service} services in {neighborhood}, {city} starting from {price_from}. Our experienced team provides fast and reliable solutions for all your needs.",
@@ -63,80 +131,29 @@ def get_ai_content(content_type, service, city, neighborhood, price_from):
     
     return placeholders.get(content_type, "[AI Content Placeholder]")
 
+@functools.lru_cache(maxsize=1024)
 def get_service_image_url(service, city):
     """
     Placeholder for image generation and upload function.
-    In the future, this will handle AI image generation and upload to WordPress media library
+    In the future, this will handle AI image generation and upload to WordPress media library.
+    Results are cached, so each service/city image is generated and uploaded once.
     """
     # Temporarily return a fixed URL
     return "http://localpageshub.local/wp-content/uploads/2025/04/images.jpeg"
 
 def create_slug(service, neighborhood, city):
     """Create a slug for the page"""
-    # Combine parts in the required format
-    raw_slug = f"{service} in {neighborhood} {city}"
-    
-    # Convert to lowercase
-    slug = raw_slug.lower()
-    
-    # Replace all special characters with hyphens
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
-    
-    # Remove hyphens from start and end
-    slug = slug.strip('-')
-    
-    return slug
+    # Lowercase, replace all special characters with hyphens and trim them from the ends
+    return _SLUG_RE.sub('-', f"{service} in {neighborhood} {city}".lower()).strip('-')
 
 def clean_html_content(content):
     """Clean HTML content before sending to WordPress"""
-    # Разбиваем контент на блоки по wp:paragraph или wp:heading
-    blocks = content.split('<!-- /wp:')
-    cleaned_blocks = []
-    
-    for block in blocks:
-        if not block.strip():
-            continue
-            
-        # Очищаем содержимое блока
-        parts = block.split('-->')
-        if len(parts) > 1:
-            # Первая часть - комментарий wp:block
-            wp_comment = parts[0].strip()
-            # Остальное - содержимое блока
-            block_content = '-->'.join(parts[1:])
-            
-            # Очищаем содержимое
-            cleaned_content = (
-                block_content
-                .strip()  # Убираем пробелы в начале и конце
-                .replace('  ', ' ')  # Заменяем двойные пробелы
-                .replace('\n\n\n', '\n\n')  # Убираем тройные переносы строк
-            )
-            
-            # Собираем блок обратно
-            cleaned_block = f"{wp_comment}-->{cleaned_content}"
-            cleaned_blocks.append(cleaned_block)
-    
-    # Собираем контент обратно с правильными закрывающими тегами
-    result = ''
-    for block in cleaned_blocks:
-        if block:
-            result += f"{block}<!-- /wp:"
-            
-    return result
+    # Collapse repeated spaces and limit blank lines to one in a single pass each
+    content = _MULTINL.sub('\n\n', _MULTISPACE.sub(' ', content))
+    return content.strip()
 
-def create_page_content(service, city, neighborhood, price_from):
-    """Create HTML content for the page"""
-    # Get image URL
-    image_url = get_service_image_url(service, city)
-    
-    # Get content from AI (currently placeholders)
-    intro = get_ai_content('intro', service, city, neighborhood, price_from)
-    expertise = get_ai_content('expertise', service, city, neighborhood, price_from)
-    coverage = get_ai_content('coverage', service, city, neighborhood, price_from)
-    cta = get_ai_content('cta', service, city, neighborhood, price_from)
-    
-    content = f"""<!-- wp:image -->
+# Page content template, split into literal text and field names once at import
+_PAGE_CONTENT_TEMPLATE = """<!-- wp:image -->
 <figure class="wp-block-image">
 <img src="{image_url}" alt="{service} services in {city}" />
 </figure>
@@ -188,56 +205,176 @@ def create_page_content(service, city, neighborhood, price_from):
 <!-- wp:paragraph -->
 <p><em>*Service available in {neighborhood}, {city} and surrounding areas. Prices may vary depending on service requirements.</em></p>
 <!-- /wp:paragraph -->"""
+_PAGE_CONTENT_PARTS = tuple(
+    (literal, field) for literal, field, _, _ in string.Formatter().parse(_PAGE_CONTENT_TEMPLATE)
+)
 
-    return content.strip()
-
-def create_wp_page(title, content, service, city, neighborhood, price_from, slug, publish=False):
-    """Create a page in WordPress"""
-    endpoint = f"{wp_url}/wp-json/wp/v2/pages"
+@functools.lru_cache(maxsize=CONTENT_CACHE_SIZE)
+def create_page_content(service, city, neighborhood, price_from, image_url):
+    """Create HTML content for the page"""
+    values = {
+        'service': service,
+        'city': city,
+        'neighborhood': neighborhood,
+        'price_from': price_from,
+        'image_url': image_url,
+        # Get content from AI (currently placeholders)
+        'intro': get_ai_content('intro', service, city, neighborhood, price_from),
+        'expertise': get_ai_content('expertise', service, city, neighborhood, price_from),
+        'coverage': get_ai_content('coverage', service, city, neighborhood, price_from),
+        'cta': get_ai_content('cta', service, city, neighborhood, price_from)
+    }
     
-    payload = {
-        "title": title,
-        "content": content,
-        "status": "publish" if publish else "draft",
-        "slug": slug,
+    parts = []
+    for literal, field in _PAGE_CONTENT_PARTS:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field])
+    
+    return "".join(parts)
+
+def new_payload():
+    """Return an empty page payload dict"""
+    return {
+        "title": None,
+        "content": None,
+        "status": None,
+        "slug": None,
         "meta": {
-            "service_area": f"{neighborhood}, {city}",
-            "service_type": service,
-            "price_from": price_from,
-            "featured_image_url": get_service_image_url(service, city)
+            "service_area": None,
+            "service_type": None,
+            "price_from": None,
+            "featured_image_url": None
         }
     }
 
+def get_payload_template():
+    """
+    Return the page payload dict of the current thread.
+    Pages are created from worker threads, so each thread fills in its own dict
+    instead of allocating a new one per page.
+    """
+    payload = getattr(_payload_local, 'payload', None)
+    if payload is None:
+        payload = _payload_local.payload = new_payload()
+    return payload
+
+def fill_payload(payload, title, content, service, city, neighborhood, price_from, slug, image_url, publish=False):
+    """Fill in a page payload dict for the WordPress REST API"""
+    payload["title"] = title
+    payload["content"] = content
+    payload["status"] = "publish" if publish else "draft"
+    payload["slug"] = slug
+    
+    meta = payload["meta"]
+    meta["service_area"] = f"{neighborhood}, {city}"
+    meta["service_type"] = service
+    meta["price_from"] = price_from
+    meta["featured_image_url"] = image_url
+    
+    return payload
+
+def create_wp_page(title, content, service, city, neighborhood, price_from, slug, image_url, publish=False):
+    """Create a page in WordPress and return its id, slug and link, or None on failure"""
+    endpoint = f"{wp_url}/wp-json/wp/v2/pages"
+    
+    payload = fill_payload(
+        get_payload_template(),
+        title, content, service, city, neighborhood, price_from, slug, image_url,
+        publish=publish
+    )
+
     try:
-        response = requests.post(
-            endpoint,
-            json=payload,
-            auth=HTTPBasicAuth(username, app_password),
-            verify=False
-        )
-        return response
+        response = SESSION.post(endpoint, data=json.dumps(payload), timeout=(5, 30))
     except requests.exceptions.RequestException as e:
         return None
+    
+    if response.status_code != 201:
+        return None
+    
+    data = json.loads(response.content)
+    return {key: data[key] for key in _PAGE_FIELDS}
 
-def validate_csv_file(file_path):
-    """Check file existence and structure"""
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"CSV file not found: {file_path}")
+def create_wp_pages(payloads):
+    """
+    Create several pages with one WordPress REST batch request.
+    Returns the id, slug and link of each page (None for pages that failed)
+    and the reason the whole batch request failed, or None if it was sent.
+    """
+    endpoint = f"{wp_url}/wp-json/batch/v1"
+    failed = [None] * len(payloads)
     
-    required_columns = {'service', 'city', 'neighborhood', 'price_from'}
+    body = {
+        "requests": [
+            {"method": "POST", "path": "/wp/v2/pages", "body": payload}
+            for payload in payloads
+        ]
+    }
     
-    with open(file_path, 'r') as file:
-        csv_reader = csv.reader(file)
-        headers = next(csv_reader, None)
-        
-        if not headers:
-            raise ValueError("CSV file is empty")
-        
-        headers_set = set(map(str.strip, headers))
-        missing_columns = required_columns - headers_set
-        
-        if missing_columns:
-            raise ValueError(f"Missing required columns in CSV file: {', '.join(missing_columns)}")
+    try:
+        # WordPress creates all pages of the batch before responding
+        response = SESSION.post(endpoint, data=json.dumps(body), timeout=(5, 120))
+    except requests.exceptions.RequestException as e:
+        return failed, f"Error sending batch request to {endpoint}: {str(e)}"
+    
+    if response.status_code != 207:
+        # e.g. 404 when the site has no batch endpoint, 400 when the batch is too large
+        return failed, f"Batch request to {endpoint} failed with status {response.status_code}"
+    
+    results = []
+    for sub_response in json.loads(response.content).get('responses', []):
+        if sub_response.get('status') == 201:
+            data = sub_response['body']
+            results.append({key: data[key] for key in _PAGE_FIELDS})
+        else:
+            results.append(None)
+    
+    # Pages without a sub-response were not created
+    return (results + failed)[:len(payloads)], None
+
+def build_page(service, city, neighborhood, price_from):
+    """Generate the image URL and HTML content of a page"""
+    image_url = get_service_image_url(service, city)
+    content = create_page_content(service, city, neighborhood, price_from, image_url)
+    return image_url, content
+
+def build_and_create_wp_page(title, service, city, neighborhood, price_from, slug, publish=False):
+    """
+    Generate page content and create the page in WordPress.
+    Runs in a worker thread, so content for one page is generated while others are being sent.
+    """
+    image_url, content = build_page(service, city, neighborhood, price_from)
+    return create_wp_page(title, content, service, city, neighborhood, price_from, slug, image_url, publish=publish)
+
+def build_and_create_wp_pages(pages, publish=False):
+    """
+    Generate content for a group of pages and create them with one batch request.
+    Each page is a (title, service, city, neighborhood, price_from, slug) tuple.
+    """
+    payloads = []
+    for title, service, city, neighborhood, price_from, slug in pages:
+        image_url, content = build_page(service, city, neighborhood, price_from)
+        payloads.append(fill_payload(
+            new_payload(),
+            title, content, service, city, neighborhood, price_from, slug, image_url,
+            publish=publish
+        ))
+    return create_wp_pages(payloads)
+
+def validate_csv_headers(headers):
+    """Check CSV file structure and return the header names without surrounding spaces"""
+    required_columns = set(_REQUIRED_FIELDS)
+    
+    if not headers:
+        raise ValueError("CSV file is empty")
+    
+    headers = [header.strip() for header in headers]
+    missing_columns = required_columns - set(headers)
+    
+    if missing_columns:
+        raise ValueError(f"Missing required columns in CSV file: {', '.join(missing_columns)}")
+    
+    return headers
 
 def get_content_preview(content):
     """Get first two lines of content"""
@@ -245,9 +382,9 @@ def get_content_preview(content):
     preview_lines = [line for line in lines if line.strip() and not line.startswith('<!--')][:2]
     return '\n'.join(preview_lines)
 
-def write_to_log(log_data):
-    """Write page data to output_log.csv"""
-    log_file = "output_log.csv"
+@contextlib.contextmanager
+def open_log(log_file="output_log.csv"):
+    """Open output_log.csv once and yield a CSV writer for page data"""
     file_exists = os.path.exists(log_file)
     
     with open(log_file, 'a', newline='') as f:
@@ -256,102 +393,195 @@ def write_to_log(log_data):
         if not file_exists:
             writer.writeheader()
         
-        writer.writerow(log_data)
+        yield writer
+
+def handle_wp_response(title, original_slug, data, publish=False):
+    """Report the result of a page creation request and return its log data"""
+    if data:
+        print(f"Created page: {title}")
+        print(f"Page ID: {data['id']}")
+        print(f"Slug: /{data['slug']}")
+        
+        # Log the created page
+        notes = f"⚠️ WP changed slug: {original_slug} → {data['slug']}" if data['slug'] != original_slug else ""
+        
+        log_data = {
+            'title': title,
+            'slug': data['slug'],
+            'status': 'publish' if publish else 'draft',
+            'url': data['link'],
+            'wp_id': data['id'],
+            'notes': notes
+        }
+        return log_data
+    
+    print(f"Error creating page: {title}")
+    return None
+
+def validate_row(row):
+    """Return the stripped required values of a CSV row and the fields that are missing or empty"""
+    # Short rows have None for the missing columns
+    values = {field: (row.get(field) or '').strip() for field in _REQUIRED_FIELDS}
+    missing_fields = tuple(field for field, value in values.items() if not value)
+    return values, missing_fields
+
+def print_skipped_row(i, missing_fields):
+    """Print the warning for a CSV row that was skipped"""
+    print(f"\n⚠️ Skipped row {i}: missing or empty field(s) \"{', '.join(missing_fields)}\"")
+
+def report_page_result(entry, log_writer, publish=False):
+    """Wait for a queued page creation request, report its result and log the created page"""
+    if entry.get('missing_fields'):
+        print_skipped_row(entry['row'], entry['missing_fields'])
+        return
+    
+    print(f"\nRow {entry['row']}")
+    try:
+        data = entry['future'].result()
+        # Batch requests return the results of the whole group
+        if entry['index'] is not None:
+            results, error = data
+            # Report a failed batch request once, before the first row of its group
+            if error and entry['index'] == 0:
+                first, last = entry['group_rows']
+                print(f"⚠️ {error}, rows {first}-{last} not created")
+            data = results[entry['index']]
+        log_data = handle_wp_response(entry['title'], entry['slug'], data, publish=publish)
+        if log_data:
+            log_writer.writerow(log_data)
+    except Exception as e:
+        print(f"Error processing page: {str(e)}")
+
+def queue_batch(batch, first_row, args, executor, pending):
+    """Validate a batch of CSV rows and queue their page creation requests in pending"""
+    # Pages sent with WordPress batch requests
+    batch_pages = []
+    
+    for i, row in enumerate(batch, first_row):
+        # Validate row
+        values, missing_fields = validate_row(row)
+        if missing_fields:
+            if args.dry_run:
+                print_skipped_row(i, missing_fields)
+            else:
+                pending.append({'row': i, 'missing_fields': missing_fields})
+            continue
+        
+        # Process valid row
+        service = values['service']
+        city = values['city']
+        neighborhood = values['neighborhood']
+        price_from = values['price_from']
+        
+        # Create page title and other data
+        title = f"{service} in {neighborhood}, {city}"
+        original_slug = create_slug(service, neighborhood, city)
+        
+        if args.dry_run:
+            _, content = build_page(service, city, neighborhood, price_from)
+            print(f"\nRow {i}")
+            print("💡 Dry-run: Страница не создана, только предпросмотр")
+            print(f"Title: {title}")
+            print(f"Slug: /{original_slug}")
+            print("\nContent preview:")
+            print(get_content_preview(content))
+            print("\n" + "-"*50)
+        elif args.batch:
+            # Sent in groups once all rows of the batch are read
+            entry = {'row': i, 'title': title, 'slug': original_slug, 'future': None, 'index': None}
+            pending.append(entry)
+            batch_pages.append((entry, (title, service, city, neighborhood, price_from, original_slug)))
+        else:
+            # Queue content generation and WordPress page creation
+            future = executor.submit(
+                build_and_create_wp_page,
+                title, 
+                service, 
+                city, 
+                neighborhood, 
+                price_from, 
+                original_slug,
+                publish=args.publish
+            )
+            pending.append({'row': i, 'title': title, 'slug': original_slug, 'future': future, 'index': None})
+    
+    # Create pages in groups of WP_BATCH_SIZE, one batch request per group
+    for start in range(0, len(batch_pages), WP_BATCH_SIZE):
+        group = batch_pages[start:start + WP_BATCH_SIZE]
+        future = executor.submit(build_and_create_wp_pages, [page for _, page in group], publish=args.publish)
+        group_rows = (group[0][0]['row'], group[-1][0]['row'])
+        for index, (entry, _) in enumerate(group):
+            entry['future'] = future
+            entry['index'] = index
+            entry['group_rows'] = group_rows
+
+def cancel_pending(pending, log_writer, publish=False):
+    """
+    Cancel queued page creation requests that have not started yet.
+    Pages already being created are still waited for and logged, so a rerun doesn't duplicate them.
+    """
+    queued = [entry for entry in pending if entry.get('future')]
+    for entry in queued:
+        entry['future'].cancel()
+    
+    for entry in queued:
+        if not entry['future'].cancelled():
+            report_page_result(entry, log_writer, publish=publish)
+
+def process_batch(batch, first_row, args, executor, log_writer):
+    """Prepare a batch of CSV rows and create their pages in WordPress"""
+    # Rows reported in CSV order once their page creation requests are sent
+    pending = []
+    reported = 0
+    
+    try:
+        queue_batch(batch, first_row, args, executor, pending)
+        
+        # Report results once all requests of the batch are sent
+        for entry in pending:
+            report_page_result(entry, log_writer, publish=args.publish)
+            reported += 1
+    finally:
+        # Stops the requests still queued when interrupted (e.g. Ctrl-C); a no-op after a complete batch
+        cancel_pending(pending[reported:], log_writer, publish=args.publish)
 
 def main():
     # Get command line arguments
     args = parse_arguments()
     
     try:
-        # Validate CSV file
-        validate_csv_file(args.csv_file)
+        if not os.path.exists(args.csv_file):
+            raise FileNotFoundError(f"CSV file not found: {args.csv_file}")
         
         # Read data from CSV
         with open(args.csv_file, 'r') as file:
-            lines = list(csv.DictReader(file))
-            total_rows = len(lines)
+            reader = csv.DictReader(file)
+            
+            # Validate CSV file from the same reader that yields the rows
+            reader.fieldnames = validate_csv_headers(reader.fieldnames)
+            rows = reader
             
             # Apply limit if specified
             if args.limit is not None:
-                lines = lines[:args.limit]
-                total_rows = min(args.limit, total_rows)
+                rows = itertools.islice(rows, args.limit)
             
-            for i, row in enumerate(lines, 1):
-                print(f"\nRow {i} of {total_rows}")
-                
-                try:
-                    # Validate row
-                    required_fields = {'service', 'city', 'neighborhood', 'price_from'}
-                    missing_fields = []
-                    
-                    for field in required_fields:
-                        value = row.get(field, '').strip()
-                        if not value:  # Проверяем на пустую строку после strip()
-                            missing_fields.append(field)
-                    
-                    if missing_fields:
-                        print(f"⚠️ Skipped row {i}: missing or empty field(s) \"{', '.join(missing_fields)}\"")
-                        continue
-                    
-                    # Process valid row
-                    service = row['service'].strip()
-                    city = row['city'].strip()
-                    neighborhood = row['neighborhood'].strip()
-                    price_from = row['price_from'].strip()
-                    
-                    # Create page title and other data
-                    title = f"{service} in {neighborhood}, {city}"
-                    original_slug = create_slug(service, neighborhood, city)
-                    content = create_page_content(service, city, neighborhood, price_from)
+            # Created pages are logged only when they are sent to WordPress
+            log = contextlib.nullcontext() if args.dry_run else open_log()
+            
+            with log as log_writer, ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+                # Process rows in batches to bound the number of requests in flight
+                first_row = 1
+                while True:
+                    batch = list(itertools.islice(rows, BATCH_SIZE))
+                    if not batch:
+                        break
                     
-                    if args.dry_run:
-                        print("💡 Dry-run: Страница не создана, только предпросмотр")
-                        print(f"Title: {title}")
-                        print(f"Slug: /{original_slug}")
-                        print("\nContent preview:")
-                        print(get_content_preview(content))
-                        print("\n" + "-"*50)
-                    else:
-                        # Create WordPress page
-                        response = create_wp_page(
-                            title, 
-                            content, 
-                            service, 
-                            city, 
-                            neighborhood, 
-                            price_from, 
-                            original_slug,
-                            publish=args.publish
-                        )
-                        
-                        if response and response.status_code == 201:
-                            data = response.json()
-                            print(f"Created page: {title}")
-                            print(f"Page ID: {data['id']}")
-                            print(f"Slug: /{data['slug']}")
-                            
-                            # Log the created page
-                            notes = f"⚠️ WP changed slug: {original_slug} → {data['slug']}" if data['slug'] != original_slug else ""
-                            
-                            log_data = {
-                                'title': title,
-                                'slug': data['slug'],
-                                'status': 'publish' if args.publish else 'draft',
-                                'url': data['link'],
-                                'wp_id': data['id'],
-                                'notes': notes
-                            }
-                            write_to_log(log_data)
-                        else:
-                            print(f"Error creating page: {title}")
-                        
-                except Exception as e:
-                    print(f"Error processing page: {str(e)}")
-                    continue
+                    process_batch(batch, first_row, args, executor, log_writer)
+                    first_row += len(batch)
             
     except Exception as e:
         print(f"Error: {str(e)}")
-        exit(1)
+        sys.exit(1)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file